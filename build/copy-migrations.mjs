@@ -37,11 +37,20 @@ for (const namespace of namespaces) {
   const srcMigrationsDir = path.join(srcInfraDir, namespace, 'migrations');
   const distMigrationsDir = path.join(distInfraDir, namespace, 'migrations');
 
-  if (fs.existsSync(srcMigrationsDir)) {
-    fs.copySync(srcMigrationsDir, distMigrationsDir);
-    const files = fs.readdirSync(srcMigrationsDir).filter(f => f.endsWith('.sql'));
-    copiedCount += files.length;
+  // List the source directory directly; a missing directory surfaces as ENOENT
+  // so no separate existence check is needed
+  let files;
+  try {
+    files = fs.readdirSync(srcMigrationsDir).filter(f => f.endsWith('.sql'));
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      continue;
+    }
+    throw error;
   }
+
+  fs.copySync(srcMigrationsDir, distMigrationsDir);
+  copiedCount += files.length;
 }
 
 console.log(`✅ Copied ${copiedCount} migration files to dist/`);
@@ -21,35 +21,63 @@ const __dirname = path.dirname(__filename);
 
 const ROOT_DIR = path.join(__dirname, '..');
 const CLI_DIR = path.join(ROOT_DIR, 'src', 'presentation', 'cli');
-const COMMANDS_DIR = path.join(CLI_DIR, 'commands');
+const COMMANDS_NAMESPACE = 'commands';
+const COMMANDS_DIR = path.join(CLI_DIR, COMMANDS_NAMESPACE);
 const OUTPUT_FILE = path.join(ROOT_DIR, 'src', 'presentation', 'cli', 'shared', 'registry', 'generated-commands.ts');
 
 // Clean Screaming Architecture directories to scan
 // Import paths are relative from shared/registry/ to feature folders (../../)
-const CLEAN_SCREAMING_DIRS = [
-  { dir: path.join(CLI_DIR, 'host'), importPrefix: '../../host' },
-  { dir: path.join(CLI_DIR, 'work'), importPrefix: '../../work' },
-  { dir: path.join(CLI_DIR, 'solution'), importPrefix: '../../solution' },
-  { dir: path.join(CLI_DIR, 'project-knowledge'), importPrefix: '../../project-knowledge' },
-  { dir: path.join(CLI_DIR, 'relations'), importPrefix: '../../relations' },
-  { dir: path.join(CLI_DIR, 'maintenance'), importPrefix: '../../maintenance' }
+const CLEAN_SCREAMING_NAMESPACES = [
+  'host',
+  'work',
+  'solution',
+  'project-knowledge',
+  'relations',
+  'maintenance'
 ];
+const CLEAN_SCREAMING_DIRS = CLEAN_SCREAMING_NAMESPACES.map(namespace => ({
+  namespace,
+  dir: path.join(CLI_DIR, namespace),
+  importPrefix: `../../${namespace}`
+}));
+
+// Patterns are compiled once here rather than on every call
+const TS_EXTENSION_PATTERN = /\.ts$/;
+// Matches metadata export patterns:
+// - export const metadata: CommandMetadata = ...
+// - export const metadata = ...
+// - export { metadata }
+const METADATA_EXPORT_PATTERN = /export\s+(const\s+metadata|{\s*metadata\s*})/;
+
+// Static preamble of the generated registry file; only the imports and entries vary per run
+const REGISTRY_HEADER = `/**
+ * Auto-generated Command Registry
+ *
+ * DO NOT EDIT THIS FILE MANUALLY
+ * Generated by: scripts/generate-command-registry.mjs
+ *
+ * To regenerate: npm run generate:commands
+ */
+
+import { RegisteredCommand } from './CommandMetadata.js';
+`;
 
 /**
  * Recursively find all .ts files in a directory
+ * Paths are returned relative to the initial directory with forward slashes on
+ * every platform; the relative prefix is carried through the recursion so no
+ * per-file path.relative() or separator normalization is needed.
  */
-function findCommandFiles(dir, baseDir = dir) {
+function findCommandFiles(dir, relativeDir = '') {
   const files = [];
   const entries = fs.readdirSync(dir, { withFileTypes: true });
 
   for (const entry of entries) {
-    const fullPath = path.join(dir, entry.name);
+    const relativePath = relativeDir ? `${relativeDir}/${entry.name}` : entry.name;
 
     if (entry.isDirectory()) {
-      files.push(...findCommandFiles(fullPath, baseDir));
+      files.push(...findCommandFiles(path.join(dir, entry.name), relativePath));
     } else if (entry.isFile() && entry.name.endsWith('.ts')) {
-      // Get relative path from commands directory
-      const relativePath = path.relative(baseDir, fullPath);
       files.push(relativePath);
     }
   }
@@ -77,6 +105,7 @@ function parseCommandPath(filePath) {
   const fullCommand = `${parent} ${subcommand}`;
 
   return {
+    parts,
     parent,
     subcommand,
     fullCommand
@@ -84,32 +113,32 @@ function parseCommandPath(filePath) {
 }
 
 /**
- * Generate import statement for a command
+ * Generate import statement and registry entry for a command
  * @param filePath - Relative path to the command file
  * @param importPrefix - The import path prefix (e.g., '../commands' or '../work')
  */
-function generateImport(filePath, importPrefix) {
-  // Convert file path to import path (remove .ts, use forward slashes)
-  const importPath = filePath.replace(/\.ts$/, '.js').replace(/\\/g, '/');
+function renderCommand(filePath, importPrefix) {
+  // Convert file path to import path (paths from findCommandFiles already use forward slashes)
+  const importPath = filePath.replace(TS_EXTENSION_PATTERN, '.js');
 
-  const { parent, subcommand, fullCommand } = parseCommandPath(filePath);
+  const { parts, fullCommand } = parseCommandPath(filePath);
 
   // Create handler name by camelCasing the command parts
   // "goal start" → "goalStart"
   // "audience pain add" → "audiencePainAdd"
-  const commandParts = fullCommand.split(' ');
-  const handlerName = commandParts
+  // Reuses the parts already split from the filename rather than re-splitting fullCommand
+  const handlerName = parts
     .map((part, index) => toHandlerCasePart(part, index))
     .join('');
   const metaName = `${handlerName}Meta`;
 
   return {
     statement: `import { ${handlerName}, metadata as ${metaName} } from '${importPrefix}/${importPath}';`,
-    handlerName,
-    metaName,
-    parent,
-    subcommand,
-    fullCommand
+    entry: `  {
+    path: '${fullCommand}',
+    metadata: ${metaName},
+    handler: ${handlerName}
+  }`
   };
 }
 
@@ -118,31 +147,15 @@ function generateImport(filePath, importPrefix) {
  * @param commandFilesWithPrefix - Array of { filePath, importPrefix, baseDir }
  */
 function generateRegistry(commandFilesWithPrefix) {
-  const imports = commandFilesWithPrefix.map(({ filePath, importPrefix }) =>
-    generateImport(filePath, importPrefix)
+  const renderedCommands = commandFilesWithPrefix.map(({ filePath, importPrefix }) =>
+    renderCommand(filePath, importPrefix)
   );
 
-  const importStatements = imports.map(imp => imp.statement).join('\n');
-
-  const commandEntries = imports.map(imp => {
-    return `  {
-    path: '${imp.fullCommand}',
-    metadata: ${imp.metaName},
-    handler: ${imp.handlerName}
-  }`;
-  }).join(',\n');
-
-  return `/**
- * Auto-generated Command Registry
- *
- * DO NOT EDIT THIS FILE MANUALLY
- * Generated by: scripts/generate-command-registry.mjs
- *
- * To regenerate: npm run generate:commands
- */
-
-import { RegisteredCommand } from './CommandMetadata.js';
+  // Both fragments are rendered once per command in renderCommand
+  const importStatements = renderedCommands.map(cmd => cmd.statement).join('\n');
+  const commandEntries = renderedCommands.map(cmd => cmd.entry).join(',\n');
 
+  return `${REGISTRY_HEADER}
 ${importStatements}
 
 export const commands: RegisteredCommand[] = [
@@ -171,43 +184,96 @@ function toHandlerCasePart(part, index) {
 /**
  * Check if a command file has metadata export
  * Reads the file and looks for "export const metadata" or "export { metadata }"
+ * A file that cannot be read resolves as not ok, with a warning for the caller to print
  * @param filePath - Relative path from baseDir
  * @param baseDir - Base directory to resolve the full path
+ * @returns Promise<{ ok: boolean, warning?: string }> - Whether the file exports metadata
  */
-function hasMetadataExport(filePath, baseDir) {
+async function hasMetadataExport(filePath, baseDir) {
   try {
     const fullPath = path.join(baseDir, filePath);
-    const content = fs.readFileSync(fullPath, 'utf-8');
-
-    // Look for metadata export patterns:
-    // - export const metadata: CommandMetadata = ...
-    // - export const metadata = ...
-    // - export { metadata }
-    const metadataPattern = /export\s+(const\s+metadata|{\s*metadata\s*})/;
-    return metadataPattern.test(content);
+    const content = await fs.promises.readFile(fullPath, 'utf-8');
+    return { ok: METADATA_EXPORT_PATTERN.test(content) };
   } catch (error) {
-    console.warn(`   Warning: Could not read ${filePath}: ${error.message}`);
-    return false;
+    return { ok: false, warning: `   Warning: Could not read ${filePath}: ${error.message}` };
   }
 }
 
+/**
+ * Keep only the command files that export metadata
+ * Files are read concurrently; results and warnings are handled in the
+ * original file order so output stays deterministic.
+ * @param files - Relative paths from baseDir
+ * @param baseDir - Base directory to resolve the full paths
+ */
+async function filterWithMetadata(files, baseDir) {
+  const results = await Promise.all(files.map(file => hasMetadataExport(file, baseDir)));
+
+  for (const { warning } of results) {
+    if (warning) {
+      console.warn(warning);
+    }
+  }
+
+  return files.filter((_, index) => results[index].ok);
+}
+
+/**
+ * List the names of subdirectories in a directory
+ * Symlinks are followed, and dangling ones are skipped. A missing directory
+ * yields an empty set.
+ * @param dir - Directory to list
+ */
+function listDirectoryNames(dir) {
+  let entries;
+  try {
+    entries = fs.readdirSync(dir, { withFileTypes: true });
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      return new Set();
+    }
+    throw error;
+  }
+
+  const names = new Set();
+  for (const entry of entries) {
+    if (entry.isDirectory()) {
+      names.add(entry.name);
+    } else if (entry.isSymbolicLink()) {
+      try {
+        if (fs.statSync(path.join(dir, entry.name)).isDirectory()) {
+          names.add(entry.name);
+        }
+      } catch {
+        // Dangling symlink - treat as absent
+      }
+    }
+  }
+
+  return names;
+}
+
 /**
  * Main execution
  */
-function main() {
+async function main() {
   console.log('🔍 Scanning for command files...');
 
   const allCommandFilesWithPrefix = [];
   let totalFiles = 0;
   let pendingMetadata = 0;
 
+  // All scanned namespaces are direct children of CLI_DIR, so a single listing
+  // replaces a separate existence check per directory
+  const presentDirs = listDirectoryNames(CLI_DIR);
+
   // 1. Scan legacy commands directory
-  if (fs.existsSync(COMMANDS_DIR)) {
+  if (presentDirs.has(COMMANDS_NAMESPACE)) {
     const legacyFiles = findCommandFiles(COMMANDS_DIR);
     totalFiles += legacyFiles.length;
     console.log(`   Legacy commands/ directory: ${legacyFiles.length} files`);
 
-    const legacyWithMetadata = legacyFiles.filter(file => hasMetadataExport(file, COMMANDS_DIR));
+    const legacyWithMetadata = await filterWithMetadata(legacyFiles, COMMANDS_DIR);
     pendingMetadata += legacyFiles.length - legacyWithMetadata.length;
 
     legacyWithMetadata.forEach(file => {
@@ -220,13 +286,13 @@ function main() {
   }
 
   // 2. Scan Clean Screaming Architecture directories
-  for (const { dir, importPrefix } of CLEAN_SCREAMING_DIRS) {
-    if (fs.existsSync(dir)) {
+  for (const { namespace, dir, importPrefix } of CLEAN_SCREAMING_DIRS) {
+    if (presentDirs.has(namespace)) {
       const cleanFiles = findCommandFiles(dir);
       totalFiles += cleanFiles.length;
-      console.log(`   Clean Screaming ${path.basename(dir)}/ directory: ${cleanFiles.length} files`);
+      console.log(`   Clean Screaming ${namespace}/ directory: ${cleanFiles.length} files`);
 
-      const cleanWithMetadata = cleanFiles.filter(file => hasMetadataExport(file, dir));
+      const cleanWithMetadata = await filterWithMetadata(cleanFiles, dir);
       pendingMetadata += cleanFiles.length - cleanWithMetadata.length;
 
       cleanWithMetadata.forEach(file => {
@@ -245,11 +311,8 @@ function main() {
   console.log('📝 Generating command registry...');
   const registryContent = generateRegistry(allCommandFilesWithPrefix);
 
-  // Ensure output directory exists
-  const outputDir = path.dirname(OUTPUT_FILE);
-  if (!fs.existsSync(outputDir)) {
-    fs.mkdirSync(outputDir, { recursive: true });
-  }
+  // Ensure output directory exists (recursive mkdir is a no-op when it already does)
+  fs.mkdirSync(path.dirname(OUTPUT_FILE), { recursive: true });
 
   // Write registry file
   fs.writeFileSync(OUTPUT_FILE, registryContent, 'utf-8');
@@ -260,4 +323,7 @@ function main() {
   }
 }
 
-main();
+main().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -17,10 +17,12 @@ export class InProcessEventBus implements IEventBus {
   private handlers = new Map<string, IEventHandler[]>();
 
   subscribe(eventType: string, handler: IEventHandler): void {
-    if (!this.handlers.has(eventType)) {
-      this.handlers.set(eventType, []);
+    const handlers = this.handlers.get(eventType);
+    if (handlers) {
+      handlers.push(handler);
+    } else {
+      this.handlers.set(eventType, [handler]);
     }
-    this.handlers.get(eventType)!.push(handler);
   }
 
   async publish(event: BaseEvent): Promise<void> {
@@ -34,25 +34,19 @@ export function validateProjectRequirement(
     return { requiresProject: false, commandPath: null };
   }
 
-  // Resolve command path from args (handling aliases)
-  const commandPath = resolveCommandPath(argv, commands);
+  // Resolve the registered command from args (handling aliases)
+  const command = resolveCommand(argv, commands);
 
-  if (!commandPath) {
+  if (!command) {
     // Unknown command or no command specified
     // Let Commander handle the error - don't require project
     return { requiresProject: false, commandPath: null };
   }
 
-  // Look up metadata
-  const command = commands.find((c) => c.path === commandPath);
-  if (!command) {
-    return { requiresProject: false, commandPath };
-  }
-
   // Default to true if requiresProject not specified
   const requiresProject = command.metadata.requiresProject ?? true;
 
-  return { requiresProject, commandPath };
+  return { requiresProject, commandPath: command.path };
 }
 
 /**
@@ -69,17 +63,18 @@ function isUtilityCommand(argv: string[]): boolean {
 }
 
 /**
- * Resolves the command path from process arguments, handling top-level aliases.
+ * Resolves the registered command from process arguments, handling top-level aliases.
+ * Returns the matched command itself so callers don't need a second lookup by path.
  *
  * Examples:
- * - ["node", "cli.js", "project", "init"] -> "project init"
- * - ["node", "cli.js", "init"] -> "project init" (via alias)
- * - ["node", "cli.js", "goal", "start", "--goal-id", "123"] -> "goal start"
+ * - ["node", "cli.js", "project", "init"] -> command with path "project init"
+ * - ["node", "cli.js", "init"] -> command with path "project init" (via alias)
+ * - ["node", "cli.js", "goal", "start", "--goal-id", "123"] -> command with path "goal start"
  */
-function resolveCommandPath(
+function resolveCommand(
   argv: string[],
   commands: RegisteredCommand[]
-): string | null {
+): RegisteredCommand | null {
   // Remove node and script path
   const args = argv.slice(2);
 
@@ -101,7 +96,7 @@ function resolveCommandPath(
   );
 
   if (aliasedCommand) {
-    return aliasedCommand.path;
+    return aliasedCommand;
   }
 
   // Otherwise, try to match as "parent subcommand"
@@ -109,7 +104,7 @@ function resolveCommandPath(
     const commandPath = `${positionalArgs[0]} ${positionalArgs[1]}`;
     const matchingCommand = commands.find((c) => c.path === commandPath);
     if (matchingCommand) {
-      return commandPath;
+      return matchingCommand;
     }
   }
 
@@ -0,0 +1,71 @@
+/**
+ * Tests for ProjectGuard
+ */
+
+import { describe, it, expect } from "@jest/globals";
+import { validateProjectRequirement } from "../../../../../src/presentation/cli/shared/guards/ProjectGuard.js";
+import { RegisteredCommand } from "../../../../../src/presentation/cli/shared/registry/CommandMetadata.js";
+
+const handler = async () => {};
+
+const commands: RegisteredCommand[] = [
+  {
+    path: "project init",
+    metadata: {
+      description: "Initialize a project",
+      topLevelAliases: ["init"],
+      requiresProject: false,
+    },
+    handler,
+  },
+  {
+    path: "goal start",
+    metadata: {
+      description: "Start a goal",
+    },
+    handler,
+  },
+];
+
+describe("ProjectGuard", () => {
+  describe("validateProjectRequirement", () => {
+    it("should resolve a top-level alias to its command", () => {
+      const result = validateProjectRequirement(["node", "cli.js", "init"], commands);
+
+      expect(result).toEqual({ requiresProject: false, commandPath: "project init" });
+    });
+
+    it("should resolve a parent subcommand path", () => {
+      const result = validateProjectRequirement(
+        ["node", "cli.js", "project", "init"],
+        commands
+      );
+
+      expect(result).toEqual({ requiresProject: false, commandPath: "project init" });
+    });
+
+    it("should ignore flags when resolving a parent subcommand path", () => {
+      const result = validateProjectRequirement(
+        ["node", "cli.js", "goal", "start", "--goal-id", "123"],
+        commands
+      );
+
+      expect(result.commandPath).toBe("goal start");
+    });
+
+    it("should not require a project for an unknown command", () => {
+      const result = validateProjectRequirement(["node", "cli.js", "unknown", "thing"], commands);
+
+      expect(result).toEqual({ requiresProject: false, commandPath: null });
+    });
+
+    it("should default requiresProject to true when metadata omits it", () => {
+      const result = validateProjectRequirement(
+        ["node", "cli.js", "goal", "start"],
+        commands
+      );
+
+      expect(result).toEqual({ requiresProject: true, commandPath: "goal start" });
+    });
+  });
+});